@@ -5,20 +5,24 @@ and call LLMs for various tasks, including embeddings and chat-based interaction
 multiple providers like OpenAI, Watsonx, Ollama, and HuggingFace.
 """
 
+import hashlib
+import importlib.util
 import os
+import threading
+from collections import OrderedDict
 from typing import Union
 
+import httpx
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseLanguageModel, BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, BaseMessage
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_ibm import WatsonxLLM
-from langchain_ollama import OllamaLLM, OllamaEmbeddings
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
+# Provider integrations (langchain_openai, langchain_ibm, ...) are imported where they are used:
+# each pulls in a large SDK, while only the configured provider's is ever needed.
 from se_agent.llm.model_configuration_manager import Configuration, TaskName
 from se_agent.llm.retry_with_backoff import retry_with_exponential_backoff
+from se_agent.util import rate_limit
 
 
 def load_llm_config():
@@ -52,6 +56,15 @@ def load_llm_config():
 config = load_llm_config()
 PROVIDER = os.getenv("LLM_PROVIDER_NAME")
 
+# Shared HTTP client so consecutive LLM calls reuse pooled keep-alive connections
+# (and skip the TCP/TLS handshake) instead of each model instance opening its own.
+# HTTP/2 multiplexing is enabled when the optional `h2` package is installed.
+http_client = httpx.Client(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=60,
+)
+
 
 def fetch_llm_for_task(task_name: TaskName, **kwargs) -> Union[BaseLanguageModel, BaseChatModel, Embeddings]:
     """Fetches the appropriate LLM or embedding model for a given task.
@@ -78,8 +91,10 @@ def fetch_llm_for_task(task_name: TaskName, **kwargs) -> Union[BaseLanguageModel
     max_tokens = task_config.max_tokens
     
     if PROVIDER == "openai":
-        return ChatOpenAI(model=model_name, max_tokens=max_tokens, **kwargs)
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(model=model_name, max_tokens=max_tokens, http_client=http_client, **kwargs)
     elif PROVIDER == "watsonx":
+        from langchain_ibm import WatsonxLLM
         return WatsonxLLM(
             model_id=model_name,
             project_id=os.getenv("WATSONX_PROJECT_ID"),
@@ -88,6 +103,7 @@ def fetch_llm_for_task(task_name: TaskName, **kwargs) -> Union[BaseLanguageModel
             params={"decoding_method": "greedy", "max_new_tokens": max_tokens},
         )
     elif PROVIDER == "ollama":
+        from langchain_ollama import OllamaLLM
         return OllamaLLM(model=model_name, max_tokens=max_tokens, **kwargs)
     else:
         raise ValueError(f"Unsupported LLM provider: {PROVIDER}")
@@ -106,10 +122,13 @@ def fetch_embedding_model(model_name: str) -> Embeddings:
         ValueError: If the provider is unsupported.
     """
     if PROVIDER == "openai":
-        return OpenAIEmbeddings(model=model_name)
+        from langchain_openai import OpenAIEmbeddings
+        return OpenAIEmbeddings(model=model_name, http_client=http_client)
     elif PROVIDER == "ollama":
+        from langchain_ollama import OllamaEmbeddings
         return OllamaEmbeddings(model=model_name)
     elif PROVIDER == "watsonx":
+        from langchain_huggingface import HuggingFaceEmbeddings
         return HuggingFaceEmbeddings(model_name=model_name)
     else:
         raise ValueError(f"Unsupported embedding provider: {PROVIDER}")
@@ -161,8 +180,64 @@ def transform_to_base_language_model_single_prompt_string(messages):
     return prompt
 
 
-@retry_with_exponential_backoff
+# Summaries are a function of their prompt alone, so identical summary requests
+# (e.g., for files with identical content) are answered from an in-process LRU cache.
+CACHEABLE_TASKS = frozenset({
+    TaskName.GENERATE_CODE_SUMMARY,
+    TaskName.GENERATE_PACKAGE_SUMMARY,
+    TaskName.GENERATE_REPO_SUMMARY,
+})
+RESPONSE_CACHE_SIZE = 4096
+_response_cache: "OrderedDict[bytes, BaseMessage]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _messages_digest(task_name: TaskName, messages: list) -> bytes:
+    """Computes a compact cache key for a task and its messages.
+
+    Args:
+        task_name (TaskName): The name of the task.
+        messages (list): A list of dictionaries with keys `role` and `content`.
+
+    Returns:
+        bytes: A digest identifying the request.
+    """
+    digest = hashlib.blake2b(task_name.value.encode(), digest_size=16)
+    for message in messages:
+        digest.update(b"\0" + message['role'].encode() + b"\0" + message['content'].encode())
+    return digest.digest()
+
+
 def call_llm_for_task(task_name: TaskName, messages: list, **kwargs):
+    """Calls the LLM for a specific task, serving repeated summary requests from cache.
+
+    Args:
+        task_name (TaskName): The name of the task to perform.
+        messages (list): A list of messages to provide as input to the LLM.
+        **kwargs: Additional arguments, see `invoke_llm_for_task`. Calls with kwargs are never cached.
+
+    Returns:
+        Union[BaseMessage, AIMessage, Any]: The response from the LLM.
+    """
+    if task_name not in CACHEABLE_TASKS or kwargs:
+        return invoke_llm_for_task(task_name, messages, **kwargs)
+
+    key = _messages_digest(task_name, messages)
+    with _response_cache_lock:
+        if key in _response_cache:
+            _response_cache.move_to_end(key)
+            return _response_cache[key]
+
+    response = invoke_llm_for_task(task_name, messages)
+    with _response_cache_lock:
+        _response_cache[key] = response
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return response
+
+
+@retry_with_exponential_backoff
+def invoke_llm_for_task(task_name: TaskName, messages: list, **kwargs):
     """Calls the LLM for a specific task with the given messages and optional parameters.
 
     Args:
@@ -177,6 +252,9 @@ def call_llm_for_task(task_name: TaskName, messages: list, **kwargs):
     Raises:
         ValueError: If the response type is unsupported.
     """
+    # Every attempt (including retries) waits for the shared rate limits
+    rate_limit.acquire(rate_limit.estimate_tokens(messages))
+
     response_format = kwargs.pop('response_format', None)
     llm = fetch_llm_for_task(task_name, **kwargs)
 
@@ -10,10 +10,18 @@ import json
 import yaml
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional, faster JSON parser
+    orjson = None
 
 DEFAULT_MAX_TOKENS = 512
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 class TaskName(Enum):
     """Enumeration of supported tasks for language models."""
     GENERATE_CODE_SUMMARY = "generate_code_summary"
@@ -84,6 +92,18 @@ class Configuration:
     """
     def __init__(self):
         self.providers: Dict[str, ProviderConfig] = {}
+        # Resolved model configuration for every (provider, task) pair, so lookups are a single dict probe
+        self._resolved: Dict[Tuple[str, TaskName], ModelConfig] = {}
+
+    def _resolve_provider(self, provider_name: str):
+        """Resolves the model configuration of every task for a provider.
+
+        Args:
+            provider_name (str): The name of the provider.
+        """
+        provider = self.providers[provider_name]
+        for task_name in TaskName:
+            self._resolved[(provider_name, task_name)] = provider.get_task_config(task_name)
 
     def add_provider(self, provider_name: str, default_model: str, default_max_tokens: Optional[int] = None):
         """Adds a provider configuration.
@@ -96,6 +116,7 @@ class Configuration:
         if default_max_tokens is None:
             default_max_tokens = DEFAULT_MAX_TOKENS
         self.providers[provider_name] = ProviderConfig(provider_name, default_model, default_max_tokens)
+        self._resolve_provider(provider_name)
 
     def set_task_config(self, provider_name: str, task_name: TaskName, max_tokens: int, model_name: Optional[str] = None):
         """Sets a task-level configuration for a provider.
@@ -113,6 +134,7 @@ class Configuration:
             raise ValueError(f"Provider '{provider_name}' is not configured. Available providers: {list(self.providers.keys())}")
         provider = self.providers[provider_name]
         provider.tasks[task_name] = ModelConfig(max_tokens=max_tokens, model_name=model_name)
+        self._resolved[(provider_name, task_name)] = provider.get_task_config(task_name)
 
     def get_task_config(self, provider_name: str, task_name: TaskName) -> ModelConfig:
         """Retrieves the configuration for a specific task under a provider.
@@ -127,9 +149,10 @@ class Configuration:
         Raises:
             ValueError: If the provider is not configured.
         """
-        if provider_name not in self.providers:
+        try:
+            return self._resolved[(provider_name, task_name)]
+        except KeyError:
             raise ValueError(f"Provider '{provider_name}' is not configured.")
-        return self.providers[provider_name].get_task_config(task_name)
 
     def load_from_dict(self, config_data: Dict):
         """Loads configurations from a dictionary.
@@ -157,7 +180,7 @@ class Configuration:
         """
         try:
             with open(yaml_file_path, "r") as file:
-                config_data = yaml.safe_load(file)
+                config_data = yaml.load(file, Loader=YamlLoader)
         except FileNotFoundError:
             raise ValueError(f"YAML file '{yaml_file_path}' not found.")
         except yaml.YAMLError as e:
@@ -174,10 +197,14 @@ class Configuration:
             ValueError: If the file is not found or there is a parsing error.
         """
         try:
-            with open(json_file_path, "r") as file:
-                config_data = json.load(file)
+            if orjson is not None:
+                with open(json_file_path, "rb") as file:
+                    config_data = orjson.loads(file.read())
+            else:
+                with open(json_file_path, "r") as file:
+                    config_data = json.load(file)
         except FileNotFoundError:
             raise ValueError(f"JSON file '{json_file_path}' not found.")
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
             raise ValueError(f"Error parsing JSON file '{json_file_path}': {e}")
         self.load_from_dict(config_data)
\ No newline at end of file
@@ -11,6 +11,7 @@ import os
 import json
 import re
 
+from collections import defaultdict
 from typing import Dict, List, Any, TypeVar, Type
 
 from langchain_core.exceptions import OutputParserException
@@ -21,6 +22,7 @@ from se_agent.llm.api import call_llm_for_task
 from se_agent.llm.model_configuration_manager import TaskName
 from se_agent.localize.localization_strategy import LocalizationStrategy
 from se_agent.project import Project
+from se_agent.util.walk import iter_files
 
 logger = logging.getLogger("se-agent")
 
@@ -132,6 +134,7 @@ class HierarchicalLocalizationStrategy(LocalizationStrategy):
 
     Attributes:
         project (Project): The project instance containing metadata and configuration.
+        _basename_index (Dict[str, List[str]]): Lazily built index of source files by file name.
     """
     def __init__(self, project: Project):
         """Initializes the strategy with the project instance.
@@ -140,6 +143,24 @@ class HierarchicalLocalizationStrategy(LocalizationStrategy):
             project (Project): The project instance containing metadata and configuration.
         """
         self.project = project
+        self._basename_index = None
+
+    def refresh(self):
+        """Drops the cached index of source files, e.g., after the repository has changed."""
+        self._basename_index = None
+
+    def _get_basename_index(self) -> Dict[str, List[str]]:
+        """Returns the index of source files by file name, building it on first use.
+
+        The index is shared by all fuzzy file path corrections, so the source folder
+        is walked at most once instead of once per localization suggestion.
+
+        Returns:
+            Dict[str, List[str]]: Full paths of the source files, keyed by file name.
+        """
+        if self._basename_index is None:
+            self._basename_index = _index_by_basename(self.project.module_src_folder)
+        return self._basename_index
 
     def localize(self, issue: Dict[str, Any], top_n: int) -> List[str]:
         """Localizes the issue to specific files.
@@ -324,18 +345,35 @@ class HierarchicalLocalizationStrategy(LocalizationStrategy):
         # Get the filename from the suggestion
         filename = localization_suggestion.file
 
-        # Search for the file in the source folder, ignoring package structure
-        for root, _, files in os.walk(self.project.module_src_folder):
-            if filename in files:
-                # Reconstruct the relative path
-                corrected_file_path = os.path.join(os.path.relpath(root, start=self.project.repo_folder), filename)
-                logger.debug(f"Fuzzily corrected file path to '{corrected_file_path}'.")
-                return corrected_file_path
+        # Search for the file in the source folder, ignoring package structure.
+        # If several files share the name, prefer the one sharing most path segments with the package.
+        candidates = self._get_basename_index().get(filename)
+        if candidates:
+            package_parts = set(localization_suggestion.package.replace('/', '.').split('.'))
+            found_path = max(candidates, key=lambda path: len(package_parts.intersection(path.split(os.sep))))
+            # Reconstruct the relative path
+            corrected_file_path = os.path.relpath(found_path, start=self.project.repo_folder)
+            logger.debug(f"Fuzzily corrected file path to '{corrected_file_path}'.")
+            return corrected_file_path
 
         # If no match is found, log and return an empty string
         logger.warning(f"Unable to fuzzily correct file path for '{filename}'.")
         return ""
 
+def _index_by_basename(root: str) -> Dict[str, List[str]]:
+    """Indexes all files under root by their file name.
+
+    Args:
+        root (str): The folder to index.
+
+    Returns:
+        Dict[str, List[str]]: Full paths of the files under root, keyed by file name.
+    """
+    index = defaultdict(list)
+    for entry in iter_files(root):
+        index[entry.name].append(entry.path)
+    return index
+
 T = TypeVar('T', bound=BaseModel)
 
 def extract_pydantic(text: str, model_class: Type[T]) -> T:
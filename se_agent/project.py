@@ -1,11 +1,16 @@
 """Module for managing GitHub projects, including cloning repositories, updating codebase understanding, and building vector stores."""
 
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 import git
+from collections import Counter
+import hashlib
 import json
 import re
 import os
 import logging
+import threading
+import time
 
 from github import Github, Auth
 from langchain_core.vectorstores import VectorStore
@@ -13,7 +18,18 @@ from langchain_core.vectorstores import VectorStore
 from se_agent.llm.api import fetch_llm_for_task
 from se_agent.llm.model_configuration_manager import TaskName
 from se_agent.project_info import ProjectInfo
-from se_agent.repository_analyzer.file_analyzer import generate_semantic_description
+from se_agent.repository_analyzer.file_analyzer import (
+    generate_semantic_description,
+    get_content_skip_reason,
+    get_semantic_description_cache_key,
+    get_semantic_description_prompt_key,
+    get_path_skip_reason,
+    EXCLUDED_PATH_SEGMENTS,
+    MAX_CODE_CHARS,
+    MAX_FILE_BYTES,
+    OVERSIZED_FILE_SUMMARY,
+    SUMMARIZABLE_EXTENSIONS
+)
 from se_agent.repository_analyzer.package_summary import generate_package_summary
 from se_agent.util.vector_store_utils import (
     get_vector_store,
@@ -22,6 +38,12 @@ from se_agent.util.vector_store_utils import (
     DEFAULT_VECTOR_TYPE, 
     VectorType
 )
+from se_agent.util.walk import iter_files
+
+try:
+    import orjson
+except ImportError:  # Optional, faster JSON serialization for the metadata files
+    orjson = None
 
 logger = logging.getLogger("se-agent")
 
@@ -30,6 +52,25 @@ PACKAGES_PROCESSED = 'packages_processed'
 UNPROCESSED_FILES = 'unprocessed_files'
 UNPROCESSED_PACKAGES = 'unprocessed_packages'
 VECTOR_STORE_FILENAME = 'vector_store.db'
+SOURCE_FILES_CACHE_FILENAME = 'source_files.json'
+SUMMARY_CACHE_FILENAME = 'summary_cache.json'
+LAST_PROCESSED_COMMIT_FILENAME = 'last_processed_commit.json'
+# Buffer size for metadata file writes; large summaries and checkpoints are written in a single syscall
+WRITE_BUFFER_SIZE = 1 << 20
+# Minimum seconds between checkpoint writes; progress in between is flushed at the end of each phase
+CHECKPOINT_FLUSH_INTERVAL = 2.0
+# Number of files summarized concurrently; LLM calls are network bound
+SUMMARY_WORKERS = max(1, int(os.getenv('SE_AGENT_SUMMARY_WORKERS', 8)))
+# Number of package summaries generated concurrently (there are typically only a few top-level packages)
+PACKAGE_SUMMARY_WORKERS = max(1, int(os.getenv('SE_AGENT_PACKAGE_SUMMARY_WORKERS', 4)))
+
+def _json_loads(data: bytes):
+    """Parses JSON, with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serializes an object to JSON, with orjson when it is installed."""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
 
 class Project:
     """Represents a GitHub project and provides methods to manage it.
@@ -45,6 +86,9 @@ class Project:
         package_details_folder (str): Directory for storing package details.
         package_summaries_folder (str): Directory for storing package summaries.
         checkpoint_file (str): Path to the checkpoint file.
+        source_files_cache_file (str): Path to the source file listing cached for the last seen commit.
+        summary_cache_file (str): Path to the persisted semantic summaries of unchanged files.
+        last_processed_commit_file (str): Path to the commit (and summary prompt key) of the last completed update.
         github (Github): Authenticated GitHub instance.
         checkpoint_data (dict): Data loaded from the checkpoint file.
     """
@@ -67,6 +111,16 @@ class Project:
         self.package_details_folder = os.path.join(self.metadata_folder, 'package_details')
         self.package_summaries_folder = os.path.join(self.metadata_folder, 'package_summaries')
         self.checkpoint_file = os.path.join(self.metadata_folder, 'checkpoint.json')
+        self.source_files_cache_file = os.path.join(self.metadata_folder, SOURCE_FILES_CACHE_FILENAME)
+        self.summary_cache_file = os.path.join(self.metadata_folder, SUMMARY_CACHE_FILENAME)
+        self.last_processed_commit_file = os.path.join(self.metadata_folder, LAST_PROCESSED_COMMIT_FILENAME)
+        # Semantic summaries by file path, along with the cache key of the content they describe (loaded on first use)
+        self.summary_cache = None
+        # Prefix stripped from package paths to make them relative to the source folder
+        src_folder = self.info.src_folder.rstrip('/')
+        self._src_prefix = "" if src_folder in ('.', '') else f"{src_folder}/"
+        # project_info is fixed for the lifetime of the instance, so compute this once
+        self._default_package_name = self._compute_default_package_name()
 
         # Authenticate with GitHub
         if (project_info.api_url):
@@ -76,6 +130,12 @@ class Project:
 
         # Load checkpoint data if it exists
         self.checkpoint_data = self.load_checkpoint()
+        # Serializes checkpoint updates from concurrent file and package summary workers
+        self._checkpoint_lock = threading.Lock()
+        self._checkpoint_dirty = False
+        self._last_checkpoint_flush = 0.0
+        # Directories known to exist, so each is created (or checked) only once
+        self._known_dirs = set()
 
     def get_github_instance(self) -> Github:
         """Returns an authenticated Github instance."""
@@ -111,8 +171,7 @@ class Project:
             str: The file path to the vector store database.
         """
         # if metadata folder doesn't exist, create it
-        if not os.path.exists(self.metadata_folder):
-            os.makedirs(self.metadata_folder, exist_ok=True)
+        self._ensure_dir(self.metadata_folder)
 
         # if vector db file doesn't exist, create it
         vector_db_filepath = os.path.join(self.metadata_folder, f"{prefix}_{VECTOR_STORE_FILENAME}" if prefix else VECTOR_STORE_FILENAME)
@@ -128,8 +187,8 @@ class Project:
             dict: The loaded checkpoint data.
         """
         if os.path.exists(self.checkpoint_file):
-            with open(self.checkpoint_file, 'r') as f:
-                checkpoint_data = json.load(f)
+            with open(self.checkpoint_file, 'rb') as f:
+                checkpoint_data = _json_loads(f.read())
         else:
             checkpoint_data = {FILES_PROCESSED: [], PACKAGES_PROCESSED: [], UNPROCESSED_FILES: {}, UNPROCESSED_PACKAGES: {}}
 
@@ -138,36 +197,74 @@ class Project:
             checkpoint_data[UNPROCESSED_FILES] = {}
 
         # Ensure unprocessed_packages is initialized as a dictionary if missing
-        if UNPROCESSED_FILES not in checkpoint_data:
-            checkpoint_data[UNPROCESSED_FILES] = {}
+        if UNPROCESSED_PACKAGES not in checkpoint_data:
+            checkpoint_data[UNPROCESSED_PACKAGES] = {}
 
-        # Ensure FILES_PROCESSED and PACKAGES_PROCESSED are lists
-        if not isinstance(checkpoint_data.get(FILES_PROCESSED), list):
-            checkpoint_data[FILES_PROCESSED] = []
-        if not isinstance(checkpoint_data.get(PACKAGES_PROCESSED), list):
-            checkpoint_data[PACKAGES_PROCESSED] = []
+        # Keep FILES_PROCESSED and PACKAGES_PROCESSED as sets in memory for constant time lookups
+        # (they are stored as lists)
+        for key in (FILES_PROCESSED, PACKAGES_PROCESSED):
+            processed = checkpoint_data.get(key)
+            checkpoint_data[key] = set(processed) if isinstance(processed, list) else set()
 
         return checkpoint_data
 
     def save_checkpoint(self):
-        """Saves the current checkpoint data to the checkpoint file."""
+        """Saves the current checkpoint data to the checkpoint file.
+
+        Writes are batched: the file is rewritten at most once every CHECKPOINT_FLUSH_INTERVAL
+        seconds. Use `_flush_checkpoint` to write pending changes right away.
+        """
+        self._checkpoint_dirty = True
+        if time.monotonic() - self._last_checkpoint_flush >= CHECKPOINT_FLUSH_INTERVAL:
+            self._flush_checkpoint()
+
+    def _flush_checkpoint(self):
+        """Writes pending checkpoint changes, atomically replacing the checkpoint file."""
+        if not self._checkpoint_dirty:
+            return
         # Validate data before saving
-        if not isinstance(self.checkpoint_data.get(FILES_PROCESSED), list):
-            self.checkpoint_data[FILES_PROCESSED] = []
-        if not isinstance(self.checkpoint_data.get(PACKAGES_PROCESSED), list):
-            self.checkpoint_data[PACKAGES_PROCESSED] = []
+        if not isinstance(self.checkpoint_data.get(FILES_PROCESSED), set):
+            self.checkpoint_data[FILES_PROCESSED] = set()
+        if not isinstance(self.checkpoint_data.get(PACKAGES_PROCESSED), set):
+            self.checkpoint_data[PACKAGES_PROCESSED] = set()
         if not isinstance(self.checkpoint_data.get(UNPROCESSED_FILES), dict):
             self.checkpoint_data[UNPROCESSED_FILES] = {}
         if not isinstance(self.checkpoint_data.get(UNPROCESSED_PACKAGES), dict):
             self.checkpoint_data[UNPROCESSED_PACKAGES] = {}
 
-        with open(self.checkpoint_file, 'w') as f:
-            json.dump(self.checkpoint_data, f)
+        # Written atomically, so an interruption never leaves a truncated checkpoint
+        self._write_file(self.checkpoint_file, _json_dumps({
+            **self.checkpoint_data,
+            FILES_PROCESSED: sorted(self.checkpoint_data[FILES_PROCESSED]),
+            PACKAGES_PROCESSED: sorted(self.checkpoint_data[PACKAGES_PROCESSED])
+        }))
+        self._checkpoint_dirty = False
+        self._last_checkpoint_flush = time.monotonic()
+
+    def load_summary_cache(self) -> dict:
+        """Loads the persisted semantic summaries if they exist.
+
+        Returns:
+            dict: Cached summaries by file path, each with the cache key of the content it describes.
+        """
+        try:
+            with open(self.summary_cache_file, 'rb') as f:
+                summary_cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return summary_cache if isinstance(summary_cache, dict) else {}
+
+    def save_summary_cache(self):
+        """Persists the cached semantic summaries."""
+        self._ensure_dir(self.metadata_folder)
+        self._write_file(self.summary_cache_file, _json_dumps(self.summary_cache))
 
     def delete_checkpoint(self):
-        """Deletes the checkpoint file if it exists."""
+        """Deletes the checkpoint file if it exists, and resets the in-memory checkpoint data."""
         if os.path.exists(self.checkpoint_file):
             os.remove(self.checkpoint_file)
+        self.checkpoint_data = self.load_checkpoint()
+        self._checkpoint_dirty = False
         
     def is_cloned(self):
         """Checks if the repository is already cloned.
@@ -183,7 +280,7 @@ class Project:
         Ensures the repository is added to Git's safe directories.
         """
         # Ensure the repository folder exists
-        os.makedirs(self.repo_folder, exist_ok=True)
+        self._ensure_dir(self.repo_folder)
 
         # Check if the repository is already cloned
         if self.is_cloned():
@@ -211,7 +308,7 @@ class Project:
                 clone_url = f"https://github.com/{self.info.repo_full_name}.git"
 
             # Prepare the local repository folder
-            os.makedirs(self.repo_folder, exist_ok=True)
+            self._ensure_dir(self.repo_folder)
 
             # Clone the repository
             logger.info(f"Cloning repository {self.info.repo_full_name} into '{self.repo_folder}'...")
@@ -240,11 +337,15 @@ class Project:
             logger.error(f"Error pulling latest changes: {e}")
             raise
         
-    def get_current_commit(self):
+    def get_current_commit(self, raise_on_error: bool = True) -> Optional[str]:
         """Fetches the current commit hash for the repository.
 
+        Args:
+            raise_on_error (bool): Whether to raise if the commit can't be determined. Defaults to True.
+
         Returns:
-            str: The current commit hash.
+            Optional[str]: The current commit hash, or None if it can't be determined (e.g., the project
+            is not a git checkout or has no commits) and raise_on_error is False.
         """
         try:
             repo = git.Repo(self.repo_folder)
@@ -252,6 +353,9 @@ class Project:
             logger.info(f"Current commit hash: {current_commit}")
             return current_commit
         except Exception as e:
+            if not raise_on_error:
+                logger.debug(f"Unable to fetch the current commit hash: {e}")
+                return None
             logger.error(f"Error fetching the current commit hash: {e}")
             raise
 
@@ -276,12 +380,20 @@ class Project:
         and updating vector stores.
 
         Args:
-            modified_files (list, optional): List of modified file paths. If None, all files are processed.
+            modified_files (list, optional): List of modified file paths. If None, the files changed since
+                the last completed update are processed, or all files if that is not known.
         """
         logger.info("Updating codebase understanding incrementally...")
 
         # Pull the latest changes from the repository
         self.pull_latest_changes()
+        head_commit = self.get_current_commit(raise_on_error=False)
+
+        if not modified_files:
+            modified_files = self._get_files_changed_since_last_update(head_commit)
+            if modified_files == []:
+                logger.info(f"No source files changed since the last update (commit {head_commit}).")
+                return
 
         # Step 1: Generate semantic summaries
         _, all_processed_files = self.generate_semantic_summaries(modified_files)
@@ -295,8 +407,48 @@ class Project:
         self.update_vector_store(VectorType.SEMANTIC_SUMMARY, all_processed_files)
 
         # Step 4: if we are here, process has not been interrupted. delete checkpoint
+        failed = self.checkpoint_data[UNPROCESSED_FILES] or self.checkpoint_data[UNPROCESSED_PACKAGES]
         self.delete_checkpoint()
         logger.info("Processing complete. Checkpoint deleted.")
+        if failed:
+            # Keep the previous commit, so the next update diffs from it and retries the failed files
+            logger.warning("Some files or packages could not be summarized; they will be retried on the next update.")
+        elif head_commit:
+            self._write_file(self.last_processed_commit_file, _json_dumps({
+                'commit': head_commit,
+                'prompt_key': get_semantic_description_prompt_key()
+            }))
+
+    def _get_files_changed_since_last_update(self, head_commit: Optional[str]) -> Optional[List[str]]:
+        """Lists the source files added or modified since the last completed update.
+
+        Args:
+            head_commit (Optional[str]): The current HEAD commit hash.
+
+        Returns:
+            Optional[List[str]]: File paths relative to the module source folder, or None if the
+            last processed commit is not known (e.g., on the first update), or all files are to be
+            processed because the model or prompt used for semantic summaries has changed since.
+        """
+        if not head_commit:
+            return None
+        try:
+            with open(self.last_processed_commit_file, 'rb') as f:
+                last_update = _json_loads(f.read())
+            if last_update.get('prompt_key') != get_semantic_description_prompt_key():
+                logger.info("Semantic summary model or prompt changed since the last update.")
+                return None
+            changed_files = git.Repo(self.repo_folder).git.diff(
+                '--name-only', '--diff-filter=ACMR', last_update['commit'], head_commit).splitlines()
+        except (OSError, ValueError, KeyError, AttributeError, git.GitCommandError) as e:
+            # E.g., the last processed commit is no longer in the history after a force push
+            logger.debug(f"Unable to determine files changed since the last update: {e}")
+            return None
+        return [
+            file.removeprefix(self._src_prefix)
+            for file in changed_files
+            if file.startswith(self._src_prefix) and file.endswith(SUMMARIZABLE_EXTENSIONS)
+        ]
 
     def generate_semantic_summaries(self, modified_files: List[str] = None) -> Tuple[List[str], List[str]]:
         """Generates semantic summaries for the specified files.
@@ -311,57 +463,241 @@ class Project:
         """
         if not modified_files:
             # Default to all .py files in the module source folder
-            modified_files = [
-                os.path.relpath(os.path.join(root, file), self.module_src_folder)
-                for root, _, files in os.walk(self.module_src_folder)
-                for file in files if file.endswith('.py')
-            ]
+            modified_files = self._get_source_files()
 
-        # Filter out already processed files
-        files_to_process = [
-            file for file in modified_files
-            if file not in self.checkpoint_data[FILES_PROCESSED]
-        ]
-        logger.info(f"Skipping already processed files: {self.checkpoint_data[FILES_PROCESSED]}.")
+        if self.checkpoint_data[FILES_PROCESSED]:
+            # Resuming an interrupted update: filter out already processed files
+            files_to_process = [
+                file for file in modified_files
+                if file not in self.checkpoint_data[FILES_PROCESSED]
+            ]
+            logger.info(f"Skipping already processed files: {self.checkpoint_data[FILES_PROCESSED]}.")
+        else:
+            # Fresh update: nothing to filter
+            files_to_process = list(modified_files)
 
         if not files_to_process:
             logger.info("No new files to process for semantic summaries.")
-            return [], self.checkpoint_data[FILES_PROCESSED]
+            return [], sorted(self.checkpoint_data[FILES_PROCESSED])
 
-        os.makedirs(self.package_details_folder, exist_ok=True)  # Ensure output directory exists
+        self._ensure_dir(self.package_details_folder)  # Ensure output directory exists
+
+        if self.summary_cache is None:
+            self.summary_cache = self.load_summary_cache()
 
         processed_files = []
-        for file_path in files_to_process:
-            full_file_path = os.path.join(self.module_src_folder, file_path)
+        try:
+            # Files are summarized independently, so overlap their LLM calls
+            with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as executor:
+                skip_reasons = list(executor.map(
+                    lambda file_path: self._summarize_file(file_path, processed_files), files_to_process))
+        finally:
+            self._flush_checkpoint()
+            self.save_summary_cache()
+
+        skipped = Counter(skip_reason for skip_reason in skip_reasons if skip_reason)
+
+        if skipped:
+            logger.info(f"Skipped files without semantic summaries: {dict(skipped)}")
+
+        # Return both newly processed files and all processed files
+        all_processed_files = sorted(self.checkpoint_data[FILES_PROCESSED])
+        return processed_files, all_processed_files
+
+    def _get_source_files(self) -> List[str]:
+        """Lists the source files to summarize, reusing the listing cached for the current commit.
+
+        The listing is persisted in the metadata folder keyed by the HEAD commit, so repeated
+        updates without new commits (e.g., after a no-op pull) skip walking the source folder.
+        It is also keyed by the source folder and the rules selecting source files, since the
+        metadata folder is shared by all source folders of the repository.
+
+        Returns:
+            List[str]: File paths relative to the module source folder.
+        """
+        head = self.get_current_commit(raise_on_error=False)
+        if not head:
+            # Not a git checkout (or no commits yet), so there is nothing to key the cache by
+            return self._list_source_files()
+
+        listing_key = hashlib.blake2b("\0".join((
+            self.module_src_folder,
+            *sorted(EXCLUDED_PATH_SEGMENTS),
+            *SUMMARIZABLE_EXTENSIONS
+        )).encode(), digest_size=16).hexdigest()
+        try:
+            with open(self.source_files_cache_file, 'rb') as f:
+                cache = _json_loads(f.read())
+            if cache.get('commit') == head and cache.get('key') == listing_key and isinstance(cache.get('files'), list):
+                logger.debug(f"Reusing source file listing for commit {head}.")
+                return cache['files']
+        except (OSError, ValueError):
+            pass
+
+        source_files = self._list_source_files()
+        self._ensure_dir(self.metadata_folder)
+        self._write_file(self.source_files_cache_file, _json_dumps({'commit': head, 'key': listing_key, 'files': source_files}))
+        return source_files
+
+    def _list_source_files(self) -> List[str]:
+        """Lists the source files to summarize in the module source folder.
+
+        Excluded folders (e.g., `__pycache__`) are not descended into.
+
+        Returns:
+            List[str]: File paths relative to the module source folder.
+        """
+        return [
+            os.path.relpath(entry.path, self.module_src_folder)
+            for entry in iter_files(self.module_src_folder, skip_dirs=EXCLUDED_PATH_SEGMENTS)
+            if entry.name.endswith(SUMMARIZABLE_EXTENSIONS)
+        ]
+
+    def _read_source(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """Reads a source file to be summarized.
+
+        Args:
+            file_path (str): File path relative to the module source folder.
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]:
+                - The file content (capped at MAX_CODE_CHARS + 1 characters so truncation can be
+                  detected downstream), or None if the file is not to be sent to the LLM.
+                - Why the file is not to be sent to the LLM, or None. "unchanged" means the
+                  file has not been modified since its semantic summary was written with the
+                  current model and prompt.
+        """
+        full_file_path = os.path.join(self.module_src_folder, file_path)
+        try:
+            file_stat = os.stat(full_file_path)
+        except OSError:
+            return None, "missing"
+        skip_reason = get_path_skip_reason(file_path)
+        if skip_reason:
+            return None, skip_reason
+        cached = self.summary_cache.get(file_path) if self.summary_cache else None
+        if cached and cached.get('prompt_key') == get_semantic_description_prompt_key():
             try:
-                if os.path.exists(full_file_path):
-                    with open(full_file_path, 'r') as file:
-                        code = file.read()
-
-                    if code.strip():
-                        summary = generate_semantic_description(code)
-                        summary_file_path = os.path.join(self.package_details_folder, f"{file_path}.md")
-                        os.makedirs(os.path.dirname(summary_file_path), exist_ok=True)
-                        with open(summary_file_path, 'w') as summary_file:
-                            summary_file.write(summary)
-                        processed_files.append(file_path)
-                        logger.info(f"Generated semantic summary for: {file_path}")
-
-                        # Update and save checkpoint after successful processing
-                        self.checkpoint_data[FILES_PROCESSED].append(file_path)
-                        self.save_checkpoint()
-                    else:
-                        logger.info(f"Skipped empty file: {file_path}")
-                else:
-                    logger.warning(f"File not found: {file_path}")
-            except Exception as e:
-                logger.exception(f"Error generating semantic summary for '{file_path}': {e}")
+                # Like make, a summary written after the last modification of the file is up to date
+                summary_file_path = os.path.join(self.package_details_folder, f"{file_path}.md")
+                if os.stat(summary_file_path).st_mtime >= file_stat.st_mtime:
+                    return None, "unchanged"
+            except OSError:
+                pass
+        if file_stat.st_size > MAX_FILE_BYTES:
+            # Don't load oversized files into memory or the prompt
+            return None, "oversized"
+        try:
+            with open(full_file_path, 'r') as file:
+                code = file.read(MAX_CODE_CHARS + 1)
+        except UnicodeDecodeError:
+            return None, "binary"
+        skip_reason = get_content_skip_reason(code)
+        return (None, skip_reason) if skip_reason else (code, None)
+
+    def _summarize_file(self, file_path: str, processed_files: List[str]) -> Optional[str]:
+        """Generates and saves the semantic summary for a single file.
+
+        Safe to call concurrently for different files.
+
+        Args:
+            file_path (str): File path relative to the module source folder.
+            processed_files (List[str]): Files processed in the current run; appended to on success.
+
+        Returns:
+            Optional[str]: Why no summary was generated for the file, or None.
+        """
+        try:
+            code, skip_reason = self._read_source(file_path)
+            if skip_reason == "missing":
+                logger.warning(f"File not found: {file_path}")
+                return skip_reason
+            if skip_reason == "oversized":
+                logger.info(f"Using stub summary for oversized file: {file_path}")
+                summary = OVERSIZED_FILE_SUMMARY
+            elif skip_reason == "unchanged":
+                logger.info(f"Semantic summary is up to date for: {file_path}")
+                summary = None
+            elif skip_reason:
+                logger.info(f"Skipped {skip_reason} file: {file_path}")
+                return skip_reason
+            else:
+                summary = self._describe(file_path, code)
+
+            if summary is not None:
+                summary_file_path = os.path.join(self.package_details_folder, f"{file_path}.md")
+                self._ensure_dir(os.path.dirname(summary_file_path))
+                self._write_file(summary_file_path, summary)
+                logger.info(f"Generated semantic summary for: {file_path}")
+
+            # Update and save checkpoint after successful processing
+            with self._checkpoint_lock:
+                processed_files.append(file_path)
+                self.checkpoint_data[FILES_PROCESSED].add(file_path)
+                self.checkpoint_data[UNPROCESSED_FILES].pop(file_path, None)
+                self.save_checkpoint()
+        except Exception as e:
+            logger.exception(f"Error generating semantic summary for '{file_path}': {e}")
+            with self._checkpoint_lock:
                 self.checkpoint_data['unprocessed_files'][file_path] = str(e)
                 self.save_checkpoint()
+        return None
 
-        # Return both newly processed files and all processed files
-        all_processed_files = self.checkpoint_data[FILES_PROCESSED]
-        return processed_files, all_processed_files
+    def _ensure_dir(self, path: str):
+        """Creates a directory (and its parents) unless it was already ensured by this instance.
+
+        Args:
+            path (str): Path of the directory.
+        """
+        if path in self._known_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._known_dirs.add(path)
+
+    def _write_file(self, path: str, content: Union[str, bytes]):
+        """Writes content to a file with a single buffered write, atomically replacing the file.
+
+        Readers (e.g., package summarization, or a resumed update) never observe a partially written file.
+
+        Args:
+            path (str): Path of the file to write.
+            content (Union[str, bytes]): The text or binary content to write.
+        """
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'wb' if isinstance(content, bytes) else 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            # Don't leave the partial file behind, e.g., for the summaries vector store to pick up
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _describe(self, file_path: str, code: str) -> str:
+        """Returns the semantic description of a file, reusing the cached one if its content is unchanged.
+
+        Args:
+            file_path (str): File path relative to the module source folder.
+            code (str): The content of the file.
+
+        Returns:
+            str: The semantic description of the file.
+        """
+        cache_key = get_semantic_description_cache_key(code)
+        # Lets later updates skip reading the file while the model and prompt are unchanged
+        prompt_key = get_semantic_description_prompt_key()
+        cached = self.summary_cache.get(file_path)
+        if cached and cached.get('key') == cache_key:
+            logger.info(f"Reusing semantic summary of unchanged file: {file_path}")
+            cached['prompt_key'] = prompt_key
+            return cached['summary']
+
+        summary = generate_semantic_description(code)
+        self.summary_cache[file_path] = {'key': cache_key, 'prompt_key': prompt_key, 'summary': summary}
+        return summary
 
     def get_top_level_packages(self, file_paths: List[str]) -> List[str]:
         """Identifies top-level packages affected by the given file paths.
@@ -372,13 +708,11 @@ class Project:
         Returns:
             List[str]: List of top-level package names.
         """
-        top_level_packages = set()
-        for file_path in file_paths:
-            if os.sep in file_path:
-                top_level_package = file_path.split(os.sep)[0]
-            else:
-                top_level_package = self._get_default_package_name()
-            top_level_packages.add(top_level_package)
+        # Files directly in the source folder (no separator) belong to the default package
+        top_level_packages = {
+            top_level_package if separator else self._default_package_name
+            for top_level_package, separator, _ in (file_path.partition(os.sep) for file_path in file_paths)
+        }
         return list(top_level_packages)
     
     def generate_package_summaries(self, top_level_packages: List[str]):
@@ -388,41 +722,73 @@ class Project:
             top_level_packages (List[str]): List of top-level package names.
         """
         logger.info(f"Regenerating package summaries for packages: {top_level_packages}")
-        os.makedirs(self.package_summaries_folder, exist_ok=True)
+        self._ensure_dir(self.package_summaries_folder)
 
-        for package in top_level_packages:
-            try:
-                # Fetch package details
-                package_details = self.fetch_package_details([package])
-
-                # Generate summary if details are available
-                if package_details:
-                    package_summary = generate_package_summary(package, package_details)
-                    # Get the package name without the src_folder path
-                    package_name = self.get_package_name(package)
-                    summary_path = os.path.join(self.package_summaries_folder, f"{package_name}.md")
-
-                    # Write the summary to a file
-                    with open(summary_path, 'w') as summary_file:
-                        summary_file.write(package_summary)
-                    logger.info(f"Generated package summary for package: {package_name}")
-
-                    # Update and save checkpoint after successful processing
-                    if package not in self.checkpoint_data[PACKAGES_PROCESSED]:
-                        self.checkpoint_data[PACKAGES_PROCESSED].append(package)
+        if not top_level_packages:
+            return
+
+        # Read the details of all packages in one pass
+        details_by_package = self.fetch_details_by_package(top_level_packages)
+
+        # Packages are summarized independently, so overlap their LLM calls
+        with ThreadPoolExecutor(max_workers=PACKAGE_SUMMARY_WORKERS) as executor:
+            for package in top_level_packages:
+                executor.submit(self._summarize_package, package, details_by_package.get(package))
+
+        # Per-package errors are recorded by _summarize_package, so all packages have been handled
+        self._flush_checkpoint()
+
+    def _summarize_package(self, package: str, package_details: Optional[str]):
+        """Generates and saves the summary of a single top-level package.
+
+        Safe to call concurrently for different packages.
+
+        Args:
+            package (str): Name of the top-level package.
+            package_details (Optional[str]): The hierarchical document of the package, if any.
+        """
+        try:
+            # Generate summary if details are available
+            if package_details:
+                package_summary = generate_package_summary(package, package_details)
+                # Get the package name without the src_folder path
+                package_name = self.get_package_name(package)
+                summary_path = os.path.join(self.package_summaries_folder, f"{package_name}.md")
+
+                # Write the summary to a file
+                self._write_file(summary_path, package_summary)
+                logger.info(f"Generated package summary for package: {package_name}")
+
+                # Update and save checkpoint after successful processing
+                with self._checkpoint_lock:
+                    self.checkpoint_data[PACKAGES_PROCESSED].add(package)
+                    self.checkpoint_data[UNPROCESSED_PACKAGES].pop(package, None)
                     self.save_checkpoint()
-            except Exception as e:
-                logger.exception(f"Error generating package summary for package '{package}': {e}")
-                # Record unprocessed packages with exceptions
+        except Exception as e:
+            logger.exception(f"Error generating package summary for package '{package}': {e}")
+            # Record unprocessed packages with exceptions
+            with self._checkpoint_lock:
                 self.checkpoint_data['unprocessed_packages'][package] = str(e)
                 self.save_checkpoint()
 
     def get_package_name(self, package):
-        if package == self._get_default_package_name():
-            return package
-        return os.path.relpath(package, self.info.src_folder)
+        """Returns the name of a package relative to the source folder.
+
+        Args:
+            package (str): Package path, relative to either the repository root or the source folder.
+
+        Returns:
+            str: The package path without the source folder prefix, or the default package
+            name if the package is the source folder itself.
+        """
+        if package == self._default_package_name or package in ('.', self._src_prefix[:-1]):
+            return self._default_package_name
+        return package.removeprefix(self._src_prefix)
 
     def _get_default_package_name(self):
+        return self._default_package_name
+
+    def _compute_default_package_name(self):
         if self.info.src_folder and self.info.src_folder != '.':
             return self.info.src_folder.split('/')[-1].strip()
         else:
@@ -572,11 +938,22 @@ class Project:
         Fetches detailed documentation for the specified packages by assembling
         a hierarchical document of each package's .md files (and its subfolders).
         """
-        package_details = ""
+        return "".join(f"{details}\n\n" for details in self.fetch_details_by_package(packages).values())
+
+    def fetch_details_by_package(self, packages: List[str]) -> Dict[str, str]:
+        """Fetches the detailed documentation of each of the specified packages.
+
+        Args:
+            packages (List[str]): Names of the packages.
+
+        Returns:
+            Dict[str, str]: The hierarchical document of each package, for the packages with package details.
+        """
+        details_by_package = {}
 
         for pkg in packages:
             # Figure out where the .md files actually live
-            if pkg == self._get_default_package_name():
+            if pkg == self._default_package_name:
                 # Means it's effectively '.' or root, so .md files live directly under package_details/
                 package_dir = self.package_details_folder
                 # Typically we don't want to recurse at the root if you're treating the root as a single "package."
@@ -591,10 +968,9 @@ class Project:
                 continue
 
             # 3. Build a hierarchical document from package_dir
-            details_for_this_package = self.create_hierarchical_document(package_dir, recurse=do_recurse)
-            package_details += details_for_this_package + "\n\n"
+            details_by_package[pkg] = self.create_hierarchical_document(package_dir, recurse=do_recurse)
 
-        return package_details
+        return details_by_package
 
     def get_package(self, filename: str) -> str:
         """
@@ -618,7 +994,7 @@ class Project:
 
                 # If the file is found directly under src_folder
                 if not relative_path or relative_path == '.':
-                    return self._get_default_package_name()
+                    return self._default_package_name
 
                 # Otherwise, return the top-level directory
                 return package_parts[0]
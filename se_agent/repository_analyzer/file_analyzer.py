@@ -1,51 +1,99 @@
 """Module for generating semantic descriptions of Code using LLM."""
 
+import hashlib
 import os
-from se_agent.llm.api import call_llm_for_task
+from typing import Optional
+
+from se_agent.llm.api import call_llm_for_task, config as llm_config, PROVIDER
 from se_agent.llm.model_configuration_manager import TaskName
 from se_agent.util.markdown import extract_code_block_content
 
-def prompt_generate_semantic_description(code):
-    """Generates a prompt for the LLM to create a semantic description of a Python file.
+# Upper bound on the code embedded in a single prompt (~50k tokens at ~4 chars/token)
+MAX_CODE_CHARS = 200_000
+# Files larger than this are not sent to the LLM at all
+MAX_FILE_BYTES = 1_000_000
+OVERSIZED_FILE_SUMMARY = "# Semantic Summary\nBinary or oversized file.\n"
+TRUNCATION_MARKER = "\n# ...[truncated]"
+
+# Only these files are summarized (the prompt describes a python file)
+SUMMARIZABLE_EXTENSIONS = ('.py',)
+# Virtualenv, vendored dependency, VCS and cache directories whose files are never summarized.
+# Matched against every folder name, so names that are also common subpackage names (e.g.,
+# `build`, `dist`) are deliberately not listed.
+EXCLUDED_PATH_SEGMENTS = frozenset({'node_modules', '.venv', 'venv', '__pycache__', '.git'})
+# Heuristics for binary or minified code (long files are truncated, not skipped)
+BINARY_SNIFF_CHARS = 8192
+MAX_AVG_LINE_LENGTH = 500
+
+def get_path_skip_reason(file_path: str) -> Optional[str]:
+    """Checks whether a file should be summarized based on its path alone.
 
     Args:
-        code (str): The content of the Python file.
+        file_path (str): Path of the file relative to the module source folder.
 
     Returns:
-        str: A formatted prompt to provide to the LLM.
+        Optional[str]: Why the file should be skipped, or None if it should be summarized.
     """
-    prompt = f"""
-Understand the following Python file and generate a semantic description for it in markdown format.
+    if not file_path.endswith(SUMMARIZABLE_EXTENSIONS):
+        return "unsupported"
+    if not EXCLUDED_PATH_SEGMENTS.isdisjoint(file_path.split(os.sep)):
+        return "excluded"
+    return None
 
-```python
-{code}
-```
+def get_content_skip_reason(code: str) -> Optional[str]:
+    """Checks whether code is worth an LLM call.
+
+    Args:
+        code (str): The content of the file.
 
-Generated document should follow this structure:
-```
+    Returns:
+        Optional[str]: Why the file should be skipped, or None if it should be summarized.
+    """
+    if not code.strip():
+        return "empty"
+    if '\x00' in code[:BINARY_SNIFF_CHARS]:
+        return "binary"
+    if len(code) / (code.count('\n') + 1) > MAX_AVG_LINE_LENGTH:
+        return "minified"
+    return None
+
+# Instructions are sent once as a constant system message (cacheable by providers'
+# prompt-prefix caching); the per-file user message carries only the code.
+SYSTEM_PROMPT = """You are an expert on generating semantic descriptions for code.
+Describe the given Python file in markdown with this structure:
 # Semantic Summary
-A brief semantic summary of the entire file. This should not exceed 100 tokens.
+Brief summary of the entire file.
 
 # Code Structures
-List of classes, functions, and other structures in the file with a brief semantic summary for each. Individual summaries should not exceed 50 tokens. E.g.,
-- Class `ClassName`: Description of the class.
-- Function `function_name`: Description of the function.
-- Enum `EnumName`: Description of the enum.
-- ...
-```
+- Class `ClassName`: One line description.
+- Function `function_name`: One line description.
+- ..."""
+_PROMPT_PREFIX = "```python\n"
+_PROMPT_SUFFIX = "\n```"
+
+def prompt_generate_semantic_description(code):
+    """Generates a prompt for the LLM to create a semantic description of a Python file.
+
+    Args:
+        code (str): The content of the Python file.
 
-"""
-    return prompt
+    Returns:
+        str: A formatted prompt to provide to the LLM.
+    """
+    return "".join((_PROMPT_PREFIX, code, _PROMPT_SUFFIX))
 
 def generate_semantic_description(code):
     """
     Generate a semantic description for code using LLM.
         Args:
-        code (str): code.
+        code (str): code. Code longer than MAX_CODE_CHARS is truncated to fit the model context.
 
     Returns:
         str: The generated semantic description in markdown format
     """
+    if len(code) > MAX_CODE_CHARS:
+        code = code[:MAX_CODE_CHARS] + TRUNCATION_MARKER
+
     # Generate the prompt for the LLM
     prompt = prompt_generate_semantic_description(code)
 
@@ -54,11 +102,42 @@ def generate_semantic_description(code):
         call_llm_for_task(
             task_name=TaskName.GENERATE_CODE_SUMMARY,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert on generating semantic descriptions for code."
-                },
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
         ).content
-    )
\ No newline at end of file
+    )
+
+def get_semantic_description_prompt_key() -> str:
+    """Computes a key identifying how semantic descriptions are currently generated.
+
+    Unlike `get_semantic_description_cache_key`, the key doesn't cover the code, so it
+    can be checked without reading a file.
+
+    Returns:
+        str: A hex digest of the prompt and model.
+    """
+    try:
+        model_name = llm_config.get_task_config(PROVIDER, TaskName.GENERATE_CODE_SUMMARY).model_name
+    except ValueError:
+        # No provider is configured (e.g., in tests with a mocked LLM); key by the prompt alone
+        model_name = None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{model_name or ''}\0{SYSTEM_PROMPT}".encode())
+    return digest.hexdigest()
+
+def get_semantic_description_cache_key(code: str) -> str:
+    """Computes a key identifying the semantic description that would be generated for code.
+
+    The key covers the code, the prompt, and the configured model, so a stored description
+    can be reused as long as none of them has changed.
+
+    Args:
+        code (str): The content of the file.
+
+    Returns:
+        str: A hex digest of the code, prompt and model.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{get_semantic_description_prompt_key()}\0{code}".encode())
+    return digest.hexdigest()
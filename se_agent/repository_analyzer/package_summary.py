@@ -4,6 +4,21 @@ from se_agent.llm.api import call_llm_for_task
 from se_agent.llm.model_configuration_manager import TaskName
 from se_agent.util.markdown import extract_code_block_content
 
+# As for file descriptions, the user message carries only the package documentation.
+# Summary length is bounded by the task's max_tokens.
+SYSTEM_PROMPT = """You are an expert at generating higher order package summaries for detailed package documentation.
+Given the hierarchical documentation of a python package, write an abstractive summary in markdown with this structure:
+# <Package Name>
+
+## Semantic Summary
+A crisp description of the full package semantics.
+
+## Contained code structure names
+Comma separated names of the most important contained sub-packages, files, classes, functions, and enums."""
+_PROMPT_PREFIX = "Package: "
+_PROMPT_INFIX = "\n```markdown\n"
+_PROMPT_SUFFIX = "\n```"
+
 def prompt_generate_package_summary(package_name: str, documentation: str) -> str:
     """Generates a prompt for summarizing a Python package.
 
@@ -14,28 +29,7 @@ def prompt_generate_package_summary(package_name: str, documentation: str) -> st
     Returns:
         str: The prompt to be used by the LLM to generate a package summary.
     """
-    prompt = f"""
-Understand the following hierarchical documentation for python package {package_name}, with semantic description of sub-packages, files, classes, and functions contained.
-
-```markdown
-{documentation}
-```
-
-Now generate an abstractive package summary in markdown format with the following structure:
-```
-# <Package Name>
-
-## Semantic Summary
-A very crisp description of the full package semantics. This should not exceed 150 tokens.
-
-## Contained code structure names
-Just a comma separated listing of contained sub-package, file, class, function, enum, or structure names. E.g.,
-`package1`, `sub_package`, `file_name.py`, `ClassName`, `function_name`, `EnumName`, `__init__.py` ...
-```
-
-Note: Whole package summary should not exceed 512 tokens. For large packages skip names of contained code structures that are relatively less importance.
-"""
-    return prompt
+    return "".join((_PROMPT_PREFIX, package_name, _PROMPT_INFIX, documentation, _PROMPT_SUFFIX))
 
 def generate_package_summary(package_name: str, package_details_content: str) -> str:
     """
@@ -54,10 +48,7 @@ def generate_package_summary(package_name: str, package_details_content: str) ->
         package_summary = call_llm_for_task(
             task_name=TaskName.GENERATE_PACKAGE_SUMMARY,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert at generating higher order package summaries for detailed package documentation"
-                },
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
         ).content
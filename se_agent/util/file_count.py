@@ -1,41 +1,78 @@
 """Script for recursively counting the number of files in a folder."""
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Iterable, Union
 
-def count_files_in_folder_recursive(folder_path, ext):
+from se_agent.util.walk import iter_files, reraise
+
+# Number of directories scanned concurrently; helps on high-latency (network) filesystems
+WALK_WORKERS = int(os.getenv('SE_AGENT_WALK_WORKERS', 8))
+
+def _scan_dir(path, ext):
+    """Scans a single directory (not its sub-directories) with os.scandir.
+
+    Returns:
+        tuple: Number of matching files in the directory and the list of its sub-directory paths.
+    """
+    file_count = 0
+    sub_dirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                sub_dirs.append(entry.path)
+            elif entry.is_file():
+                # Count files that end with the specified extension, or all files
+                file_count += entry.name.endswith(ext) if ext else 1
+    return file_count, sub_dirs
+
+def _scan(path, ext, workers=WALK_WORKERS):
+    """Counts files under path, scanning up to `workers` directories concurrently."""
+    if workers <= 1:
+        return sum(1 for entry in iter_files(path, on_error=reraise) if not ext or entry.name.endswith(ext))
+
+    file_count = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_dir, path, ext)}
+        # Keep submitting discovered sub-directories until no scans are in flight
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                count, sub_dirs = future.result()
+                file_count += count
+                pending.update(executor.submit(_scan_dir, sub_dir, ext) for sub_dir in sub_dirs)
+    return file_count
+
+def count_files_in_folder_recursive(folder_path: str, ext: Union[str, Iterable[str], None] = None) -> int:
     """Counts the number of files in a folder recursively, optionally filtering by extension.
 
     Args:
         folder_path (str): Path to the folder to count files in.
-        ext (str): Optional extension to filter files (e.g., '.txt'). If None, counts all files.
+        ext (str or list or tuple or set): Optional extension(s) to filter files (e.g., '.txt' or
+            ('.py', '.pyi')), counted in a single traversal. If None, counts all files.
 
     Returns:
-        int or str: Number of files counted or an error message if an exception occurs.
+        int: Number of files counted.
+
+    Raises:
+        OSError: If the folder (or one of its sub-folders) cannot be read, e.g., FileNotFoundError.
     """
-    try:
-        file_count = 0
-        # Walk through the directory tree and count the files
-        for root, dirs, files in os.walk(folder_path):
-            if ext:
-                # Count files that end with the specified extension
-                file_count += len([file for file in files if file.endswith(ext)])
-            else:
-                # Count all files
-                file_count += len(files)
-        return file_count
-    except FileNotFoundError:
-        return "The specified folder was not found."
-    except Exception as e:
-        return f"An error occurred: {e}"
+    # str.endswith accepts a tuple of suffixes and checks them all in one call
+    ext = tuple(ext) if isinstance(ext, (list, tuple, set)) else ((ext,) if ext else None)
+    return _scan(folder_path, ext)
 
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Recursively count the number of files in a folder.")
     parser.add_argument("folder_path", type=str, help="Path to the folder to count files in.")
-    parser.add_argument("--ext", type=str, default=None, help="Optional extension of the files to count.")
+    parser.add_argument("--ext", type=str, nargs="+", default=None, help="Optional extension(s) of the files to count.")
 
     args = parser.parse_args()
 
-    file_count = count_files_in_folder_recursive(args.folder_path, args.ext)
-    print(f"Number of files ({args.ext if args.ext else 'all'}) in the folder (including subdirectories): {file_count}")
\ No newline at end of file
+    try:
+        file_count = count_files_in_folder_recursive(args.folder_path, args.ext)
+    except OSError as e:
+        sys.exit(str(e))
+    print(f"Number of files ({', '.join(args.ext) if args.ext else 'all'}) in the folder (including subdirectories): {file_count}")
\ No newline at end of file
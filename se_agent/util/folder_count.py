@@ -1,26 +1,22 @@
 """Script for recursively counting the number of folders in a specified directory."""
 
-import os
+import sys
 
-def count_folders_in_folder_recursive(folder_path):
+from se_agent.util.walk import iter_dirs, reraise
+
+def count_folders_in_folder_recursive(folder_path: str) -> int:
     """Counts the number of folders in a directory recursively.
 
     Args:
         folder_path (str): The path to the directory to count folders in.
 
     Returns:
-        int or str: The total number of folders found, or an error message if an exception occurs.
+        int: The total number of folders found.
+
+    Raises:
+        OSError: If the directory (or one of its sub-directories) cannot be read, e.g., FileNotFoundError.
     """
-    try:
-        folder_count = 0
-        # Walk through the directory tree and count the subdirectories
-        for root, dirs, files in os.walk(folder_path):
-            folder_count += len(dirs)
-        return folder_count
-    except FileNotFoundError:
-        return "The specified folder was not found."
-    except Exception as e:
-        return f"An error occurred: {e}"
+    return sum(1 for _ in iter_dirs(folder_path, on_error=reraise))
 
 if __name__ == "__main__":
     import argparse
@@ -36,5 +32,8 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    folder_count = count_folders_in_folder_recursive(args.folder_path)
+    try:
+        folder_count = count_folders_in_folder_recursive(args.folder_path)
+    except OSError as e:
+        sys.exit(str(e))
     print(f"Number of folders in the folder (including subdirectories): {folder_count}")
\ No newline at end of file
@@ -1,4 +1,4 @@
-import re
+FENCE = "```"
 
 def extract_code_block_content(input_string: str) -> str:
     """Extracts the content inside a code block fence from the input string.
@@ -9,13 +9,24 @@ def extract_code_block_content(input_string: str) -> str:
     Returns:
         str: The content inside the code block fence if found; otherwise, returns the original input string.
     """
-    # Compile regex pattern to match exactly one opening and one closing code fence
-    pattern = re.compile(r'^```(?:\w+)?\r?\n(.*?)\r?\n```$', re.DOTALL)
+    # Check if the input_string is entirely wrapped in a code block fence, i.e.,
+    # an opening fence line (with an optional language) and a closing fence at the end.
+    # Plain string searches are used instead of a regex, as this runs on every LLM response.
+    if not input_string.startswith(FENCE):
+        return input_string
 
-    # Check if the input_string is entirely wrapped in a code block fence
-    match = pattern.match(input_string)
-    if match:
-        # If matched, extract the content inside the fences
-        input_string = match.group(1)
+    first_newline = input_string.find("\n")
+    if first_newline < 0:
+        return input_string
+    language = input_string[len(FENCE):first_newline].removesuffix("\r")
+    if not all(char.isalnum() or char == "_" for char in language):
+        return input_string
 
-    return input_string
\ No newline at end of file
+    body = input_string[first_newline + 1:]
+    # Like regex `$`, tolerate a single trailing newline after the closing fence
+    body = body.removesuffix("\n")
+    if not body.endswith("\n" + FENCE):
+        return input_string
+
+    # If matched, extract the content inside the fences
+    return body[:-len(FENCE) - 1].removesuffix("\r")
@@ -0,0 +1,81 @@
+"""Process-wide rate limiting for LLM calls.
+
+All LLM entry points (file summaries, package summaries, localization, suggestions) share
+the limiters below, so concurrent callers collectively stay within the provider's
+requests-per-minute and tokens-per-minute limits instead of triggering rate-limit retries.
+Limits are read from the `LLM_REQUESTS_PER_MINUTE` and `LLM_TOKENS_PER_MINUTE` environment
+variables; a limit that is unset or 0 is not enforced.
+"""
+
+import os
+import threading
+import time
+
+REQUESTS_PER_MINUTE = int(os.getenv('LLM_REQUESTS_PER_MINUTE', 0))
+TOKENS_PER_MINUTE = int(os.getenv('LLM_TOKENS_PER_MINUTE', 0))
+# Rough average for English text and code across common tokenizers
+CHARS_PER_TOKEN = 4
+
+class TokenBucket:
+    """Thread-safe token bucket that refills `rate` units evenly over every `period` seconds.
+
+    Attributes:
+        capacity (float): Maximum number of units that can be acquired in a burst.
+        fill_rate (float): Units added to the bucket per second.
+    """
+    def __init__(self, rate: float, period: float = 60.0):
+        """Initializes a full bucket.
+
+        Args:
+            rate (float): Number of units allowed per period.
+            period (float, optional): Length of the period in seconds. Defaults to 60.
+        """
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._available = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1):
+        """Blocks until `amount` units are available, then consumes them.
+
+        Args:
+            amount (float, optional): Units to consume. Requests larger than the capacity wait
+                for a full bucket. Defaults to 1.
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._available = min(self.capacity, self._available + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                wait = (amount - self._available) / self.fill_rate
+            time.sleep(wait)
+
+_request_bucket = TokenBucket(REQUESTS_PER_MINUTE) if REQUESTS_PER_MINUTE > 0 else None
+_token_bucket = TokenBucket(TOKENS_PER_MINUTE) if TOKENS_PER_MINUTE > 0 else None
+
+def estimate_tokens(messages: list) -> int:
+    """Estimates the prompt tokens of a list of messages.
+
+    Args:
+        messages (list): A list of dictionaries with keys `role` and `content`.
+
+    Returns:
+        int: The estimated number of tokens.
+    """
+    return sum(len(message['content']) for message in messages) // CHARS_PER_TOKEN + 1
+
+def acquire(tokens_estimate: int):
+    """Blocks until one more LLM request of about `tokens_estimate` tokens is within the limits.
+
+    Args:
+        tokens_estimate (int): Estimated tokens of the request.
+    """
+    if _request_bucket:
+        _request_bucket.acquire()
+    if _token_bucket:
+        _token_bucket.acquire(tokens_estimate)
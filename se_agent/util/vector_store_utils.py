@@ -2,12 +2,13 @@
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import List
-from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
-from langchain_milvus import Milvus
+
+from se_agent.util.walk import iter_files
 
 logger = logging.getLogger("se-agent")
 
@@ -20,6 +21,9 @@ class VectorType(Enum):
 
 
 DEFAULT_VECTOR_TYPE = VectorType.SEMANTIC_SUMMARY.value
+READ_WORKERS = 16
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_WORKERS = 4
 
 
 def get_vector_store(embeddings: Embeddings, uri: str) -> VectorStore:
@@ -32,6 +36,8 @@ def get_vector_store(embeddings: Embeddings, uri: str) -> VectorStore:
     Returns:
         VectorStore: The Milvus vector store instance.
     """
+    # Imported on first use, as it pulls in the (large) Milvus client
+    from langchain_milvus import Milvus
 
     vector_store = Milvus(
         embedding_function=embeddings,
@@ -52,16 +58,23 @@ def create_or_update_vector_store(source_dir: str, uri: str, embeddings: Embeddi
     Returns:
         VectorStore: The vector store instance.
     """
-    contents, filepaths = [], []
-    for root, _, files in os.walk(source_dir):
-        for file in files:
-            file_path = os.path.join(root, file)
-            with open(file_path, 'r') as f:
-                contents.append(f.read())
-            filepaths.append(os.path.join(path_prefix, os.path.relpath(file_path, source_dir)))
+    file_paths = _list_files(source_dir)
+    # Reads are storage-latency bound, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        contents = list(executor.map(_read_file, file_paths))
+    filepaths = [os.path.join(path_prefix, os.path.relpath(file_path, source_dir)) for file_path in file_paths]
 
     return add_documents(contents, filepaths, uri, embeddings)
 
+def _list_files(source_dir: str) -> List[str]:
+    """Lists all files under source_dir recursively, skipping folders that can't be listed."""
+    return [entry.path for entry in iter_files(source_dir)]
+
+def _read_file(file_path: str) -> str:
+    """Reads the full content of a file."""
+    with open(file_path, 'r') as f:
+        return f.read()
+
 def add_documents(contents: List[str], filepaths: List[str], uri: str, embeddings: Embeddings) -> VectorStore:
     """Adds documents to a vector store, creating it if it does not exist.
 
@@ -74,20 +87,35 @@ def add_documents(contents: List[str], filepaths: List[str], uri: str, embedding
     Returns:
         VectorStore: The vector store instance.
     """
-    vector_store = Milvus(
-        embedding_function=embeddings,
-        connection_args={"uri": uri},
-        index_params=None if uri.startswith("http") else {"index_type": "FLAT", "metric_type": "L2", "params": {}}
-    )
+    vector_store = get_vector_store(embeddings, uri)
 
     if filepaths:
-        vector_store.add_documents(
-            documents=[
-                Document(page_content=content, metadata={"filepath": filepath})
-                for content, filepath in zip(contents, filepaths)
-            ],
+        # Embed each distinct content only once; identical files (vendored copies, empty
+        # __init__.py, generated code, ...) reuse the vector but keep their own filepath/ID
+        unique_contents = list(dict.fromkeys(contents))
+        vector_by_content = dict(zip(unique_contents, _embed_in_batches(unique_contents, embeddings)))
+        vector_store.add_embeddings(
+            texts=contents,
+            embeddings=[vector_by_content[content] for content in contents],
+            metadatas=[{"filepath": filepath} for filepath in filepaths],
             ids=filepaths,
         )
-        logger.info(f"Added {len(filepaths)} documents to the vector store.")
+        logger.info(f"Added {len(filepaths)} documents ({len(unique_contents)} distinct) to the vector store.")
 
     return vector_store
+
+def _embed_in_batches(texts: List[str], embeddings: Embeddings) -> List[List[float]]:
+    """Embeds texts in fixed-size batches, with up to EMBEDDING_WORKERS batch requests in flight.
+
+    Args:
+        texts (List[str]): The texts to embed.
+        embeddings (Embeddings): The embedding function to use.
+
+    Returns:
+        List[List[float]]: The embedding vectors, in the same order as texts.
+    """
+    batches = [texts[i:i + EMBEDDING_BATCH_SIZE] for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)]
+    if len(batches) <= 1:
+        return embeddings.embed_documents(texts)
+    with ThreadPoolExecutor(max_workers=EMBEDDING_WORKERS) as executor:
+        return [vector for batch_vectors in executor.map(embeddings.embed_documents, batches) for vector in batch_vectors]
@@ -0,0 +1,62 @@
+"""Utilities for walking directory trees with os.scandir.
+
+Unlike os.walk, entries carry the file type from the directory listing, so no extra
+stat call is made per entry, and no per-directory lists of names are built.
+"""
+
+import os
+from typing import AbstractSet, Callable, Iterator, Optional
+
+def _walk(root: str, skip_dirs: AbstractSet[str], on_error: Optional[Callable[[OSError], None]]) -> Iterator[os.DirEntry]:
+    """Yields every entry under root, depth first, without following symlinked directories."""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError as e:
+            # Like os.walk, folders that are missing or can't be listed are skipped unless on_error raises
+            if on_error is not None:
+                on_error(e)
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        stack.append(entry.path)
+                        yield entry
+                else:
+                    yield entry
+
+def reraise(error: OSError):
+    """An `on_error` handler that aborts the walk by raising the error."""
+    raise error
+
+def iter_files(root: str, skip_dirs: AbstractSet[str] = frozenset(),
+               on_error: Optional[Callable[[OSError], None]] = None) -> Iterator[os.DirEntry]:
+    """Iterates over the files under a folder recursively.
+
+    Args:
+        root (str): The folder to walk.
+        skip_dirs (AbstractSet[str]): Names of folders not to descend into, at any depth. Defaults to none.
+        on_error (Optional[Callable[[OSError], None]]): Called with the error when a folder can't be
+            listed; it may raise to abort the walk. Defaults to None, which skips such folders.
+
+    Returns:
+        Iterator[os.DirEntry]: The entries of the files (including symlinks to files).
+    """
+    return (entry for entry in _walk(root, skip_dirs, on_error) if entry.is_file())
+
+def iter_dirs(root: str, skip_dirs: AbstractSet[str] = frozenset(),
+              on_error: Optional[Callable[[OSError], None]] = None) -> Iterator[os.DirEntry]:
+    """Iterates over the folders under a folder recursively (excluding the folder itself).
+
+    Args:
+        root (str): The folder to walk.
+        skip_dirs (AbstractSet[str]): Names of folders to neither yield nor descend into. Defaults to none.
+        on_error (Optional[Callable[[OSError], None]]): Called with the error when a folder can't be
+            listed; it may raise to abort the walk. Defaults to None, which skips such folders.
+
+    Returns:
+        Iterator[os.DirEntry]: The entries of the folders. Symlinks to folders are not followed or yielded.
+    """
+    return (entry for entry in _walk(root, skip_dirs, on_error) if entry.is_dir(follow_symlinks=False))
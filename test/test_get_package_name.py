@@ -2,6 +2,27 @@ import pytest
 from se_agent.project import Project
 from se_agent.project_info import ProjectInfo
 
+
+@pytest.fixture(scope="module")
+def project_factory():
+    """Builds one Project per src_folder, shared by all parametrized cases in the module.
+
+    Safe because get_package_name and _get_default_package_name do not mutate the Project.
+    """
+    projects = {}
+
+    def make(src_folder):
+        if src_folder not in projects:
+            project_info = ProjectInfo(
+                repo_full_name="my-org/my-repo",
+                src_folder=src_folder,
+                github_token="fake-token"
+            )
+            projects[src_folder] = Project(github_token="fake-token", projects_store="/tmp", project_info=project_info)
+        return projects[src_folder]
+
+    return make
+
 @pytest.mark.parametrize(
     "src_folder,package_input,expected_package_name",
     [
@@ -32,21 +53,14 @@ from se_agent.project_info import ProjectInfo
         (".", "top_level_package_1/sub_package", "top_level_package_1/sub_package"),
     ]
 )
-def test_get_package_name(src_folder, package_input, expected_package_name):
+def test_get_package_name(project_factory, src_folder, package_input, expected_package_name):
     """
     Verifies that Project.get_package_name(...) correctly strips out the src_folder path
     and returns the correct relative package name.
     """
 
-    # Create a mock ProjectInfo
-    project_info = ProjectInfo(
-        repo_full_name="my-org/my-repo",
-        src_folder=src_folder,
-        github_token="fake-token"
-    )
-
-    # Create a Project instance
-    project = Project(github_token="fake-token", projects_store="/tmp", project_info=project_info)
+    # Get the (shared) Project instance for this src_folder
+    project = project_factory(src_folder)
 
     # Call get_package_name
     actual_package_name = project.get_package_name(package_input)
@@ -68,18 +82,13 @@ def test_get_package_name(src_folder, package_input, expected_package_name):
         ("", "my-repo"),  # if you allow empty string
     ]
 )
-def test_default_package_name(src_folder, expected_package_name):
+def test_default_package_name(project_factory, src_folder, expected_package_name):
     """
     Verifies the private method Project._get_default_package_name()
     handles 'src_folder' logic when it's '.' or other nested paths.
     """
 
-    project_info = ProjectInfo(
-        repo_full_name="my-org/my-repo",
-        src_folder=src_folder,
-        github_token="fake-token"
-    )
-    project = Project(github_token="fake-token", projects_store="/tmp", project_info=project_info)
+    project = project_factory(src_folder)
 
     # Directly call _get_default_package_name
     actual = project._get_default_package_name()
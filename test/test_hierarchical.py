@@ -1,19 +1,52 @@
 import os
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import pytest
 from se_agent.localize.hierarchical import FileLocalizationSuggestion, HierarchicalLocalizationStrategy
 
 
+class FakeDirEntry:
+    """Minimal stand-in for os.DirEntry."""
+    def __init__(self, path, is_dir=False):
+        self.path = path
+        self.name = os.path.basename(path)
+        self._is_dir = is_dir
+
+    def is_dir(self, follow_symlinks=True):
+        return self._is_dir
+
+    def is_file(self, follow_symlinks=True):
+        return not self._is_dir
+
+
+class FakeScandirIterator:
+    """Minimal stand-in for the iterator (and context manager) returned by os.scandir."""
+    def __init__(self, entries):
+        self._entries = iter(entries)
+
+    def __iter__(self):
+        return self._entries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def fake_scandir(tree):
+    """Builds an os.scandir replacement listing entries from a {folder: [FakeDirEntry]} mapping."""
+    return lambda path: FakeScandirIterator(tree.get(path, []))
+
+
 @pytest.fixture
 def mock_project():
-    """Fixture to create a mock project instance."""
-    project = MagicMock()
-    project.repo_folder = "/mock/repo"
-    project.module_src_folder = "/mock/repo/src"
-    project_info = MagicMock()
-    project_info.src_folder = "src"
-    project.project_info = project_info
-    return project
+    """Fixture to create a lightweight stand-in for a project instance."""
+    return SimpleNamespace(
+        repo_folder="/mock/repo",
+        module_src_folder="/mock/repo/src",
+        info=SimpleNamespace(src_folder="src"),
+    )
 
 
 @pytest.fixture
@@ -44,16 +77,18 @@ def test_file_path_exists(mock_exists, hierarchical_strategy):
 
 
 @patch("os.path.exists")
-@patch("os.walk")
-def test_fuzzy_correction(mock_walk, mock_exists, hierarchical_strategy):
+@patch("os.scandir")
+def test_fuzzy_correction(mock_scandir, mock_exists, hierarchical_strategy):
     """Test when the file path needs fuzzy correction."""
     # Mock the file path to not exist
     mock_exists.return_value = False
 
-    # Simulate os.walk returning a valid path for the file
-    mock_walk.return_value = [
-        ("/mock/repo/src/package/subpackage", [], ["file.py"]),
-    ]
+    # Simulate os.scandir listing a valid path for the file
+    mock_scandir.side_effect = fake_scandir({
+        "/mock/repo/src": [FakeDirEntry("/mock/repo/src/package", is_dir=True)],
+        "/mock/repo/src/package": [FakeDirEntry("/mock/repo/src/package/subpackage", is_dir=True)],
+        "/mock/repo/src/package/subpackage": [FakeDirEntry("/mock/repo/src/package/subpackage/file.py")],
+    })
 
     suggestion = FileLocalizationSuggestion(
         package="file.py",
@@ -66,19 +101,19 @@ def test_fuzzy_correction(mock_walk, mock_exists, hierarchical_strategy):
 
     result = hierarchical_strategy.fuzzy_get_file_path(suggestion)
     assert result == "src/package/subpackage/file.py"
-    mock_walk.assert_called_once_with("/mock/repo/src")
+    assert mock_scandir.call_args_list[0].args == ("/mock/repo/src",)
     mock_exists.assert_called_once_with("/mock/repo/src/file/py/file.py")
 
 
 @patch("os.path.exists")
-@patch("os.walk")
-def test_no_fuzzy_match(mock_walk, mock_exists, hierarchical_strategy):
+@patch("os.scandir")
+def test_no_fuzzy_match(mock_scandir, mock_exists, hierarchical_strategy):
     """Test when no fuzzy match can be found."""
     # Mock the file path to not exist
     mock_exists.return_value = False
 
-    # Simulate os.walk not finding the file
-    mock_walk.return_value = []
+    # Simulate os.scandir not finding the file
+    mock_scandir.side_effect = fake_scandir({})
 
     suggestion = FileLocalizationSuggestion(
         package="package.subpackage",
@@ -91,5 +126,56 @@ def test_no_fuzzy_match(mock_walk, mock_exists, hierarchical_strategy):
 
     result = hierarchical_strategy.fuzzy_get_file_path(suggestion)
     assert result == ""
-    mock_walk.assert_called_once_with("/mock/repo/src")
-    mock_exists.assert_called_once_with("/mock/repo/src/package/subpackage/nonexistent.py")
\ No newline at end of file
+    mock_scandir.assert_called_once_with("/mock/repo/src")
+    mock_exists.assert_called_once_with("/mock/repo/src/package/subpackage/nonexistent.py")
+
+@patch("os.path.exists")
+@patch("os.scandir")
+def test_fuzzy_index_built_once(mock_scandir, mock_exists, hierarchical_strategy):
+    """Test that the source folder is scanned once across multiple fuzzy corrections."""
+    mock_exists.return_value = False
+    mock_scandir.side_effect = fake_scandir({
+        "/mock/repo/src": [
+            FakeDirEntry("/mock/repo/src/a.py"),
+            FakeDirEntry("/mock/repo/src/b.py"),
+        ],
+    })
+
+    hierarchical_strategy.get_file_path = MagicMock(return_value="src/package/missing.py")
+
+    results = [
+        hierarchical_strategy.fuzzy_get_file_path(
+            FileLocalizationSuggestion(package="package", file=filename, confidence=0.8, reason="Fuzzy match")
+        )
+        for filename in ["a.py", "b.py", "c.py"]
+    ]
+
+    assert results == ["src/a.py", "src/b.py", ""]
+    assert mock_scandir.call_count == 1
+
+
+@patch("os.path.exists")
+@patch("os.scandir")
+def test_fuzzy_correction_prefers_package_match(mock_scandir, mock_exists, hierarchical_strategy):
+    """Test that among files with the same name, the one under the suggested package wins."""
+    mock_exists.return_value = False
+    mock_scandir.side_effect = fake_scandir({
+        "/mock/repo/src": [
+            FakeDirEntry("/mock/repo/src/package", is_dir=True),
+            FakeDirEntry("/mock/repo/src/other", is_dir=True),
+        ],
+        "/mock/repo/src/other": [FakeDirEntry("/mock/repo/src/other/utils.py")],
+        "/mock/repo/src/package": [FakeDirEntry("/mock/repo/src/package/utils.py")],
+    })
+
+    suggestion = FileLocalizationSuggestion(
+        package="package",
+        file="utils.py",
+        confidence=0.8,
+        reason="Fuzzy match"
+    )
+
+    hierarchical_strategy.get_file_path = MagicMock(return_value="src/package/sub/utils.py")
+
+    result = hierarchical_strategy.fuzzy_get_file_path(suggestion)
+    assert result == "src/package/utils.py"
@@ -1,5 +1,6 @@
 import json
 import pytest
+import yaml
 
 from se_agent.llm.model_configuration_manager import Configuration, TaskName
 
@@ -27,9 +28,15 @@ def test_get_task_config_default():
     assert task_config.max_tokens == DEFAULT_MAX_TOKENS
     assert task_config.model_name == "gpt-4o"
 
-def test_load_from_dict():
+def test_get_task_config_unknown_provider():
     config = Configuration()
-    config_data = {
+    with pytest.raises(ValueError, match="Provider 'openai' is not configured."):
+        config.get_task_config("openai", TaskName.GENERATE_PACKAGE_SUMMARY)
+
+@pytest.fixture(scope="module")
+def config_payload():
+    """Configuration data shared by the loader tests."""
+    return {
         "providers": {
             "openai": {
                 "default_model": "gpt-4o",
@@ -46,69 +53,35 @@ def test_load_from_dict():
             }
         }
     }
-    config.load_from_dict(config_data)
-    assert "openai" in config.providers
-    assert config.providers["openai"].default_model == "gpt-4o"
-    assert config.providers["openai"].default_max_tokens == 1500
-    task_config = config.get_task_config("openai", TaskName.GENERATE_CODE_SUMMARY)
-    assert task_config.max_tokens == 2000
-    assert task_config.model_name == "gpt-4o"
-    task_config = config.get_task_config("openai", TaskName.LOCALIZE)
-    assert task_config.max_tokens == 1500
-    assert task_config.model_name == "gpt-3.5-turbo"
 
-def test_load_from_yaml(tmp_path):
-    config = Configuration()
-    yaml_content = """
-    providers:
-      openai:
-        default_model: "gpt-4o"
-        default_max_tokens: 1500
-        tasks:
-          generate_code_summary:
-            max_tokens: 2000
-          localize:
-            max_tokens: 1500
-            model_name: "gpt-3.5-turbo"
-    """
-    yaml_file = tmp_path / "config.yaml"
-    yaml_file.write_text(yaml_content)
-    config.load_from_yaml(str(yaml_file))
-    assert "openai" in config.providers
-    assert config.providers["openai"].default_model == "gpt-4o"
-    assert config.providers["openai"].default_max_tokens == 1500
-    task_config = config.get_task_config("openai", TaskName.GENERATE_CODE_SUMMARY)
-    assert task_config.max_tokens == 2000
-    assert task_config.model_name == "gpt-4o"
+@pytest.fixture(scope="module")
+def config_files(config_payload, tmp_path_factory):
+    """Writes the configuration data to YAML and JSON files once per module."""
+    config_dir = tmp_path_factory.mktemp("config")
+    yaml_file = config_dir / "config.yaml"
+    yaml_file.write_text(yaml.safe_dump(config_payload))
+    json_file = config_dir / "config.json"
+    json_file.write_text(json.dumps(config_payload))
+    return {"yaml": str(yaml_file), "json": str(json_file)}
 
-def test_load_from_json(tmp_path):
+@pytest.mark.parametrize("loader", ["dict", "yaml", "json"])
+def test_load(loader, config_payload, config_files):
     config = Configuration()
-    json_content = {
-        "providers": {
-            "openai": {
-                "default_model": "gpt-4o",
-                "default_max_tokens": 1500,
-                "tasks": {
-                    "generate_code_summary": {
-                        "max_tokens": 2000
-                    },
-                    "localize": {
-                        "max_tokens": 1500,
-                        "model_name": "gpt-3.5-turbo"
-                    }
-                }
-            }
-        }
-    }
-    json_file = tmp_path / "config.json"
-    json_file.write_text(json.dumps(json_content))
-    config.load_from_json(str(json_file))
+    if loader == "dict":
+        config.load_from_dict(config_payload)
+    elif loader == "yaml":
+        config.load_from_yaml(config_files["yaml"])
+    else:
+        config.load_from_json(config_files["json"])
     assert "openai" in config.providers
     assert config.providers["openai"].default_model == "gpt-4o"
     assert config.providers["openai"].default_max_tokens == 1500
     task_config = config.get_task_config("openai", TaskName.GENERATE_CODE_SUMMARY)
     assert task_config.max_tokens == 2000
     assert task_config.model_name == "gpt-4o"
+    task_config = config.get_task_config("openai", TaskName.LOCALIZE)
+    assert task_config.max_tokens == 1500
+    assert task_config.model_name == "gpt-3.5-turbo"
 
 def test_load_from_yaml_file_not_found():
     config = Configuration()
@@ -1,3 +1,8 @@
+"""Tests for package summary generation.
+
+The LLM is mocked per test, so these tests share no state and can be run in
+parallel with pytest-xdist (`pytest -n auto`).
+"""
 import pytest
 from unittest.mock import patch
 from se_agent.repository_analyzer.package_summary import generate_package_summary
@@ -0,0 +1,255 @@
+import git
+import json
+import os
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from se_agent.project import Project, FILES_PROCESSED, PACKAGES_PROCESSED, UNPROCESSED_FILES, UNPROCESSED_PACKAGES
+from se_agent.project_info import ProjectInfo
+
+MOCK_FILES = {
+    "package1/module1.py": "def func1():\n    return 1\n",
+    "package2/module2.py": "def func2():\n    return 2\n",
+    "package2/subpackage/module3.py": "class Module3:\n    pass\n",
+}
+
+def _touch_source_files(project):
+    """Moves the modification time of all mock source files past that of their summaries."""
+    later = os.stat(project.package_details_folder).st_mtime + 10
+    for file_path in MOCK_FILES:
+        os.utime(os.path.join(project.module_src_folder, file_path), (later, later))
+
+def _commit_source_files(project, file_paths):
+    """Commits the given mock source files to the project's repository, initializing it if needed."""
+    repo = git.Repo.init(project.repo_folder)
+    repo.index.add([os.path.join(project.info.src_folder, file_path) for file_path in file_paths])
+    author = git.Actor("Test", "test@example.com")
+    repo.index.commit("Update sources", author=author, committer=author)
+
+@pytest.fixture
+def project_fixture(tmp_path):
+    """Project whose repository contains a small mock source tree under 'src'."""
+    project_info = ProjectInfo(
+        repo_full_name="my-org/my-repo",
+        src_folder="src",
+        github_token="fake-token"
+    )
+    project = Project("fake-token", str(tmp_path), project_info)
+    for file_path, content in MOCK_FILES.items():
+        full_path = os.path.join(project.module_src_folder, file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w") as f:
+            f.write(content)
+    # Bytecode caches are not source files and must not be summarized
+    os.makedirs(os.path.join(project.module_src_folder, "package1", "__pycache__"))
+    with open(os.path.join(project.module_src_folder, "package1", "__pycache__", "module1.py"), "w") as f:
+        f.write("cached = True\n")
+    os.makedirs(project.metadata_folder, exist_ok=True)
+    return project
+
+@pytest.fixture(autouse=True)
+def patched():
+    """Mocks the git pull, the LLM calls and the vector stores for every test in this module."""
+    with patch.object(Project, "pull_latest_changes") as pull, \
+            patch.object(Project, "update_vector_store") as update_vector_store, \
+            patch("se_agent.project.generate_semantic_description", return_value="Mock summary") as describe, \
+            patch("se_agent.project.generate_package_summary", return_value="Mock package summary") as package_summary:
+        yield SimpleNamespace(
+            pull=pull,
+            update_vector_store=update_vector_store,
+            describe=describe,
+            package_summary=package_summary
+        )
+
+def test_full_update(patched, project_fixture):
+    """All source files and top-level packages are summarized and the checkpoint is cleared."""
+    with patch.object(Project, "fetch_details_by_package", wraps=project_fixture.fetch_details_by_package) as mock_fetch:
+        project_fixture.update_codebase_understanding()
+
+    # Package details are read in a single batch
+    mock_fetch.assert_called_once()
+    assert set(mock_fetch.call_args.args[0]) == {"package1", "package2"}
+
+    patched.pull.assert_called_once()
+    assert patched.describe.call_count == len(MOCK_FILES)
+    for file_path in MOCK_FILES:
+        with open(os.path.join(project_fixture.package_details_folder, f"{file_path}.md")) as f:
+            assert f.read() == "Mock summary"
+
+    assert {call.args[0] for call in patched.package_summary.call_args_list} == {"package1", "package2"}
+    assert "# package2.subpackage" in dict(call.args for call in patched.package_summary.call_args_list)["package2"]
+    assert sorted(os.listdir(project_fixture.package_summaries_folder)) == ["package1.md", "package2.md"]
+
+    for call in patched.update_vector_store.call_args_list:
+        assert set(call.args[1]) == set(MOCK_FILES)
+    assert not os.path.exists(project_fixture.checkpoint_file)
+
+
+def test_modified_files_only(patched, project_fixture):
+    """Only the given modified files, and their top-level packages, are summarized."""
+    project_fixture.update_codebase_understanding({"package2/subpackage/module3.py"})
+
+    patched.describe.assert_called_once_with(MOCK_FILES["package2/subpackage/module3.py"])
+    assert [call.args[0] for call in patched.package_summary.call_args_list] == ["package2"]
+    assert os.listdir(project_fixture.package_details_folder) == ["package2"]
+
+
+def test_failures_are_checkpointed(patched, project_fixture):
+    """Failed files are recorded as unprocessed, and an interrupted update keeps its checkpoint."""
+    patched.update_vector_store.side_effect = RuntimeError("Vector store unavailable")
+    def describe(code):
+        if "Module3" in code:
+            raise RuntimeError("LLM error")
+        return "Mock summary"
+    patched.describe.side_effect = describe
+    patched.package_summary.side_effect = lambda package, details: "Mock package summary" if package == "package1" else 1 / 0
+
+    with pytest.raises(RuntimeError, match="Vector store unavailable"):
+        project_fixture.update_codebase_understanding()
+
+    assert os.path.exists(project_fixture.checkpoint_file)
+    with open(project_fixture.checkpoint_file) as f:
+        checkpoint_data = json.load(f)
+    assert set(checkpoint_data[FILES_PROCESSED]) == {"package1/module1.py", "package2/module2.py"}
+    assert set(checkpoint_data[UNPROCESSED_FILES]) == {"package2/subpackage/module3.py"}
+    assert checkpoint_data[PACKAGES_PROCESSED] == ["package1"]
+    assert set(checkpoint_data[UNPROCESSED_PACKAGES]) == {"package2"}
+
+
+def test_resume_skips_processed_files(patched, project_fixture):
+    """Files recorded in an existing checkpoint are not summarized again."""
+    with open(project_fixture.checkpoint_file, "w") as f:
+        json.dump({FILES_PROCESSED: ["package1/module1.py", "package2/module2.py"]}, f)
+    project_fixture.checkpoint_data = project_fixture.load_checkpoint()
+
+    project_fixture.update_codebase_understanding()
+
+    patched.describe.assert_called_once_with(MOCK_FILES["package2/subpackage/module3.py"])
+    for call in patched.update_vector_store.call_args_list:
+        assert set(call.args[1]) == set(MOCK_FILES)
+
+
+def test_source_files_cached_per_commit(patched, project_fixture):
+    """The source folder is walked once per commit across updates."""
+    _commit_source_files(project_fixture, MOCK_FILES)
+
+    with patch.object(Project, "_list_source_files", wraps=project_fixture._list_source_files) as mock_list:
+        project_fixture.update_codebase_understanding()
+        # Forget the last update, so the next one is a full update again
+        os.remove(project_fixture.last_processed_commit_file)
+        project_fixture.update_codebase_understanding()
+
+    mock_list.assert_called_once()
+
+
+def test_source_files_cached_per_source_folder(patched, project_fixture):
+    """A cached listing is not reused for another source folder of the same repository."""
+    _commit_source_files(project_fixture, MOCK_FILES)
+    project_fixture._get_source_files()
+
+    subpackage_project = Project("fake-token", project_fixture.projects_store, ProjectInfo(
+        repo_full_name="my-org/my-repo",
+        src_folder=os.path.join("src", "package2"),
+        github_token="fake-token"
+    ))
+
+    assert sorted(subpackage_project._get_source_files()) == ["module2.py", os.path.join("subpackage", "module3.py")]
+
+
+def test_unchanged_files_reuse_summaries(patched, project_fixture):
+    """Only files whose content changed since the previous update are sent to the LLM again."""
+    project_fixture.update_codebase_understanding()
+    with open(os.path.join(project_fixture.module_src_folder, "package2", "module2.py"), "w") as f:
+        f.write("def func2():\n    return 22\n")
+    # Touch all files (e.g., as a fresh checkout would), so only their content tells them apart
+    _touch_source_files(project_fixture)
+    patched.describe.reset_mock()
+
+    project_fixture.update_codebase_understanding()
+
+    patched.describe.assert_called_once_with("def func2():\n    return 22\n")
+    for file_path in MOCK_FILES:
+        with open(os.path.join(project_fixture.package_details_folder, f"{file_path}.md")) as f:
+            assert f.read() == "Mock summary"
+
+
+def test_summaries_newer_than_files_are_kept(patched, project_fixture):
+    """Files not modified since their summaries were written are not even read again."""
+    project_fixture.update_codebase_understanding()
+    patched.describe.reset_mock()
+
+    with patch("se_agent.project.get_semantic_description_cache_key") as mock_cache_key:
+        project_fixture.update_codebase_understanding()
+
+    mock_cache_key.assert_not_called()
+    patched.describe.assert_not_called()
+    for call in patched.update_vector_store.call_args_list:
+        assert set(call.args[1]) == set(MOCK_FILES)
+
+
+def test_summaries_regenerated_when_prompt_changes(patched, project_fixture):
+    """Summaries newer than their files are still regenerated after the prompt changes."""
+    project_fixture.update_codebase_understanding()
+    patched.describe.reset_mock()
+
+    with patch("se_agent.repository_analyzer.file_analyzer.SYSTEM_PROMPT", "Describe the code."):
+        project_fixture.update_codebase_understanding()
+
+    assert patched.describe.call_count == len(MOCK_FILES)
+
+
+def test_committed_summaries_regenerated_when_prompt_changes(patched, project_fixture):
+    """An update without new commits still regenerates all summaries after the prompt changes."""
+    _commit_source_files(project_fixture, MOCK_FILES)
+    project_fixture.update_codebase_understanding()
+    patched.describe.reset_mock()
+
+    with patch("se_agent.repository_analyzer.file_analyzer.SYSTEM_PROMPT", "Describe the code."):
+        project_fixture.update_codebase_understanding()
+
+    assert patched.describe.call_count == len(MOCK_FILES)
+
+
+def test_only_files_changed_since_last_update(patched, project_fixture):
+    """After a completed update, only the files changed in new commits are processed."""
+    _commit_source_files(project_fixture, MOCK_FILES)
+    project_fixture.update_codebase_understanding()
+
+    # No new commits: nothing to do
+    patched.update_vector_store.reset_mock()
+    project_fixture.update_codebase_understanding()
+    patched.update_vector_store.assert_not_called()
+
+    with open(os.path.join(project_fixture.module_src_folder, "package2", "module2.py"), "w") as f:
+        f.write("def func2():\n    return 22\n")
+    _commit_source_files(project_fixture, ["package2/module2.py"])
+
+    with patch.object(Project, "_list_source_files") as mock_list:
+        project_fixture.update_codebase_understanding()
+
+    mock_list.assert_not_called()
+    assert [call.args[0] for call in patched.package_summary.call_args_list[-1:]] == ["package2"]
+    for call in patched.update_vector_store.call_args_list:
+        assert call.args[1] == ["package2/module2.py"]
+
+
+def test_failed_files_are_retried_on_next_update(patched, project_fixture):
+    """Files that failed to summarize are retried even if no new commits were made."""
+    _commit_source_files(project_fixture, MOCK_FILES)
+    def describe(code):
+        if "Module3" in code:
+            raise RuntimeError("LLM error")
+        return "Mock summary"
+    patched.describe.side_effect = describe
+    project_fixture.update_codebase_understanding()
+
+    patched.describe.side_effect = None
+    patched.describe.reset_mock()
+    project_fixture.update_codebase_understanding()
+
+    patched.describe.assert_called_once_with(MOCK_FILES["package2/subpackage/module3.py"])
+    assert os.path.exists(os.path.join(project_fixture.package_details_folder, "package2/subpackage/module3.py.md"))
+    # Everything is summarized now, so the next update has nothing to do
+    patched.describe.reset_mock()
+    project_fixture.update_codebase_understanding()
+    patched.describe.assert_not_called()